@@ -18,8 +18,6 @@ from doorstop_edit.main_window import MainWindow
 from doorstop_edit.pinned_items.pinned_items_view import PinnedItemsView
 from doorstop_edit.settings import PersistentSetting
 from doorstop_edit.theme import Theme
-from doorstop_edit.ui_gen.ui_item_viewer import Ui_ItemViewer
-from doorstop_edit.utils.version_summary import create_version_summary
 
 logger = logging.getLogger("gui")
 
@@ -116,8 +114,8 @@ class DoorstopEdit(AppSignals):
         self.window.close()
 
     def _update_document_list(self) -> None:
-
-        self.window.ui.tree_combo_box.clear()
+        combo_box = self.window.ui.tree_combo_box
+        combo_box.clear()
         for i, (name, doc) in enumerate(self.doorstop_data.get_documents().items()):
             parent = self.doorstop_data.find_document(doc.parent)
             if parent is None:
@@ -125,10 +123,10 @@ class DoorstopEdit(AppSignals):
             else:
                 parent_text = f" (-> {parent.prefix})"
             text = name + parent_text
-            self.window.ui.tree_combo_box.addItem(text, name)
-            self.window.ui.tree_combo_box.setItemData(i, doc.path, Qt.ItemDataRole.ToolTipRole)
+            combo_box.addItem(text, name)
+            combo_box.setItemData(i, doc.path, Qt.ItemDataRole.ToolTipRole)
             if i == 0:
-                self.window.ui.tree_combo_box.setToolTip(doc.path)
+                combo_box.setToolTip(doc.path)
 
     def _update_item_tree(self, document: Optional[doorstop.Document]) -> None:
         self.tree_view.update(document.prefix if document else None)
@@ -161,11 +159,10 @@ class DoorstopEdit(AppSignals):
             self._update_used_document(None)
             return
 
-        doc_uid = self.window.ui.tree_combo_box.itemData(index)
+        combo_box = self.window.ui.tree_combo_box
+        doc_uid = combo_box.itemData(index)
         # Copy tooltip from entry to main widget.
-        self.window.ui.tree_combo_box.setToolTip(
-            self.window.ui.tree_combo_box.itemData(index, Qt.ItemDataRole.ToolTipRole)
-        )
+        combo_box.setToolTip(combo_box.itemData(index, Qt.ItemDataRole.ToolTipRole))
 
         logger.debug("Selected document changed to %s", doc_uid)
 
@@ -218,6 +215,8 @@ class DoorstopEdit(AppSignals):
             dock.close()
 
     def _on_about_clicked(self) -> None:
+        from doorstop_edit.utils.version_summary import create_version_summary
+
         def on_clicked(text: str) -> bool:
             QGuiApplication.clipboard().setText(text)
             return True
@@ -246,6 +245,8 @@ class DoorstopEdit(AppSignals):
             self._open_item_in_current_document(item_uid)
 
     def _popup_item_viewer(self, item_uid: str) -> None:
+        from doorstop_edit.ui_gen.ui_item_viewer import Ui_ItemViewer
+
         item = self.doorstop_data.find_item(item_uid)
         if item is None:
             return
@@ -336,8 +337,9 @@ WARNING: This operation cannot be undone!
 
     @Slot(int)
     def _update_render_progress(self, percentage: int) -> None:
-        self.window.ui.render_progress_bar.setMaximum(100)
-        self.window.ui.render_progress_bar.setValue(percentage)
+        progress_bar = self.window.ui.render_progress_bar
+        progress_bar.setMaximum(100)
+        progress_bar.setValue(percentage)
 
     @Slot(str)
     def _on_renderer_search_box_text_changed(self, text: str) -> None:
@@ -2,13 +2,17 @@
 
 import tempfile
 from pathlib import Path
-from typing import Any, Iterator
+from typing import TYPE_CHECKING, Any, Iterator
 
 import pytest
+from PySide6.QtWidgets import QApplication
 
 from doorstop_edit.doorstop_data import DoorstopData
 from tools.gen_sample_tree import generate_tree
 
+if TYPE_CHECKING:
+    from doorstop_edit.application import DoorstopEdit
+
 NUM_DOC = 3
 NUM_ITEMS_PER_DOC = 30
 
@@ -21,6 +25,25 @@ def tree_root() -> Iterator[Path]:
         yield root
 
 
+@pytest.fixture(scope="session")
+def app_session(qapp: QApplication, tree_root: Path) -> Iterator["DoorstopEdit"]:
+    """Create DoorstopEdit using the shared session QApplication (`qapp`).
+
+    Created only once per session since QApplcation cannot be recreated reliably in a process, thus
+    it is hard to recreate DoorstopEdit for each test.
+
+    When DoorstopEdit is recreate QApplication still have references to the old instance which cause
+    troubles.
+    """
+    # Imported here to not load the whole application (incl. QtWebEngine) for every test module.
+    from doorstop_edit.application import DoorstopEdit
+
+    app = DoorstopEdit(tree_root)
+    app.start()  # Must show it, clicks wont work otherwise.
+    yield app
+    app.quit()
+
+
 @pytest.fixture()
 def doorstop_data(tree_root: Path) -> DoorstopData:
     dd = DoorstopData(None, tree_root)
@@ -35,6 +58,9 @@ class QSettingsMock:
     def value(self, name: Any, default_val: Any, type: Any) -> Any:
         return default_val
 
+    def contains(self, name: Any) -> bool:
+        return False
+
     def beginGroup(self, val: str) -> None:
         pass
 
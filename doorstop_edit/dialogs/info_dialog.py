@@ -1,10 +1,10 @@
 from typing import Callable, Optional
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QDialog, QDialogButtonBox, QSizePolicy, QWidget
 
 from doorstop_edit.ui_gen.ui_info_dialog import Ui_Dialog
+from doorstop_edit.utils.icons import get_icon
 
 
 class _InfoDialog(QDialog):
@@ -37,7 +37,7 @@ class InfoDialog:
             extra_button.hide()
         else:
             extra_button.setText(extra_button_name)
-            extra_button.setIcon(QIcon(extra_button_icon))
+            extra_button.setIcon(get_icon(extra_button_icon))
             if extra_button_cb is not None:
                 extra_button.clicked.connect(extra_button_cb)
 
@@ -8,10 +8,9 @@ from doorstop.core.types import UID as DOORSTOP_UID
 from doorstop.core.types import Level as doorstop_Level
 from doorstop.core.types import Text as doorstop_Text
 from PySide6.QtCore import QKeyCombination, QPoint, QSize, Qt, QTimer, Slot
-from PySide6.QtGui import QAction, QGuiApplication, QIcon, QTextCursor, QValidator
+from PySide6.QtGui import QAction, QGuiApplication, QTextCursor, QValidator
 from PySide6.QtWidgets import (
     QCheckBox,
-    QFormLayout,
     QLabel,
     QLineEdit,
     QListWidget,
@@ -32,6 +31,7 @@ from doorstop_edit.theme import Theme
 from doorstop_edit.ui_gen.ui_main import Ui_MainWindow
 from doorstop_edit.utils.custom_color_item_delegate import CustomColorItemDelegate
 from doorstop_edit.utils.debug_timer import time_function
+from doorstop_edit.utils.icons import get_icon
 from doorstop_edit.utils.spell_checker import TextEditSpellChecker
 
 logger = logging.getLogger("gui")
@@ -277,7 +277,7 @@ class ItemEditView:
         for field in self.fields:
             self._connect_field(field)
 
-        self.format_action = QAction(QIcon(":/icons/format-text"), "Format Text", self.ui.edit_item_dock_widget)
+        self.format_action = QAction(get_icon(":/icons/format-text"), "Format Text", self.ui.edit_item_dock_widget)
         self.format_action.setShortcut(QKeyCombination(Qt.Modifier.ALT, Qt.Key.Key_Q))
         self.format_action.triggered.connect(self._on_markdown_format_text_edit)
         self.ui.edit_item_dock_widget.addAction(self.format_action)  # To enable shortcut.
@@ -327,31 +327,29 @@ class ItemEditView:
         is selected/edited (if not None).
         """
 
-        def create_label(name: str, row: int) -> QLabel:
-            label = QLabel(self.ui.item_edit_group)
-            label.setObjectName(name + "_label")
-            label.setText(name.replace("_", " ").replace("-", " ").capitalize())
-            label.setMaximumWidth(100)  # Larger values will squeeze away space from the input boxes.
-            label.setToolTip(f"Custom attribute '{name}'")
-            self.ui.item_edit_form_layout.setWidget(row, QFormLayout.ItemRole.LabelRole, label)
-            return label
-
-        def create_text_edit(name: str, row: int) -> QPlainTextEdit:
-            edit_text = QPlainTextEdit(self.ui.item_edit_group)
-            edit_text.setObjectName(name + "_line_edit")
+        # Simple properties are passed as constructor keywords (PySide feature) which sets them
+        # in the same call as the widget is created.
+
+        def create_label(name: str) -> QLabel:
+            return QLabel(
+                name.replace("_", " ").replace("-", " ").capitalize(),
+                self.ui.item_edit_group,
+                objectName=name + "_label",
+                toolTip=f"Custom attribute '{name}'",
+                maximumWidth=100,  # Larger values will squeeze away space from the input boxes.
+            )
+
+        def create_text_edit(name: str) -> QPlainTextEdit:
+            edit_text = QPlainTextEdit(self.ui.item_edit_group, objectName=name + "_line_edit")
             edit_text.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
             edit_text.setMinimumSize(QSize(200, 100))
             edit_text.setMaximumSize(QSize(620, 300))
             edit_text.setLineWrapMode(self.ui.item_edit_text_text_edit.lineWrapMode())
-            self.ui.item_edit_form_layout.setWidget(row, QFormLayout.ItemRole.FieldRole, edit_text)
             self.spell_checkers.append(TextEditSpellChecker(edit_text.document()))
             return edit_text
 
-        def create_check_box(name: str, row: int) -> QCheckBox:
-            check_box = QCheckBox(self.ui.item_edit_group)
-            check_box.setObjectName(name + "_check_box")
-            self.ui.item_edit_form_layout.setWidget(row, QFormLayout.ItemRole.FieldRole, check_box)
-            return check_box
+        def create_check_box(name: str) -> QCheckBox:
+            return QCheckBox(self.ui.item_edit_group, objectName=name + "_check_box")
 
         default_attrs: Dict[str, Any] = {}
         if item.document._attribute_defaults is not None:
@@ -368,10 +366,11 @@ class ItemEditView:
             if ex_attr_name in self._loaded_extended_attributes:
                 # Already loaded.
                 continue
-            row = self.ui.item_edit_form_layout.count() + 1
             if ex_attr_type is str:
-                label = create_label(ex_attr_name, row)
-                edit_text_widget = create_text_edit(ex_attr_name, row)
+                label = create_label(ex_attr_name)
+                edit_text_widget = create_text_edit(ex_attr_name)
+                # Append label and field in one call (one row) rather than setting each role separately.
+                self.ui.item_edit_form_layout.addRow(label, edit_text_widget)
                 field = Field(
                     widget=edit_text_widget,
                     item_attr=ex_attr_name,
@@ -385,8 +384,9 @@ class ItemEditView:
                 self.fields.append(field)
                 self._loaded_extended_attributes[ex_attr_name] = (label, edit_text_widget)
             elif ex_attr_type is bool:
-                label = create_label(ex_attr_name, row)
-                check_box_widget = create_check_box(ex_attr_name, row)
+                label = create_label(ex_attr_name)
+                check_box_widget = create_check_box(ex_attr_name)
+                self.ui.item_edit_form_layout.addRow(label, check_box_widget)
                 field = Field(
                     widget=check_box_widget,
                     item_attr=ex_attr_name,
@@ -430,9 +430,14 @@ class ItemEditView:
                 elif isinstance(field.widget, (QLineEdit)):
                     field.widget.setText(field.conv_to_widget(attr))
                 elif isinstance(field.widget, (QListWidget)):
-                    field.widget.clear()
-                    for w_item in field.conv_to_widget(attr):
-                        field.widget.addItem(w_item)
+                    # Repaint once when all items has been replaced.
+                    field.widget.setUpdatesEnabled(False)
+                    try:
+                        field.widget.clear()
+                        for w_item in field.conv_to_widget(attr):
+                            field.widget.addItem(w_item)
+                    finally:
+                        field.widget.setUpdatesEnabled(True)
                 else:
                     logger.warning(f"conv_to_widget not implemented for {type(field.widget)}")
             self._enable(True)
@@ -523,18 +528,18 @@ class ItemEditView:
 
         actions = []
 
-        add_action = QAction(QIcon(":/icons/add-link"), "Add", self.ui.item_edit_link_list)
+        add_action = QAction(get_icon(":/icons/add-link"), "Add", self.ui.item_edit_link_list)
         add_action.triggered.connect(self._open_links_picker)
         actions.append(add_action)
 
         if w_item is not None:
             item_uid = w_item.data(Qt.ItemDataRole.UserRole)
 
-            remove_action = QAction(QIcon(":/icons/remove-link"), "Remove", self.ui.item_edit_link_list)
+            remove_action = QAction(get_icon(":/icons/remove-link"), "Remove", self.ui.item_edit_link_list)
             remove_action.triggered.connect(self._remove_selected_links_from_widget)
             actions.append(remove_action)
 
-            view_action = QAction(QIcon(":/icons/view-item"), "Popup", self.ui.item_edit_link_list)
+            view_action = QAction(get_icon(":/icons/view-item"), "Popup", self.ui.item_edit_link_list)
             view_action.triggered.connect(
                 lambda checked=False, item_uid=item_uid: self._signals.view_item.emit(item_uid, True)
             )
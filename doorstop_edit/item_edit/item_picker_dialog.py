@@ -5,7 +5,7 @@ from PySide6.QtWidgets import QDialog, QListWidgetItem, QWidget
 
 from doorstop_edit.doorstop_data import DoorstopData
 from doorstop_edit.ui_gen.ui_item_picker import Ui_ItemPickerDialog
-from doorstop_edit.utils.item_utils import match_item
+from doorstop_edit.utils.item_utils import compile_search, match_item
 
 
 class _ItemPickerDialog(QDialog):
@@ -32,20 +32,27 @@ class ItemPickerDialog:
         self._update_search_result(text.split())
 
     def _update_search_result(self, search: List[str]) -> None:
-        self._dialog.ui.search_result.clear()
-        for item in self._doorstop_data.iter_items():
-            if not match_item(item, search):
-                continue
-
-            text = f"[{item}] - {item.header}"
-            w_item = QListWidgetItem(text)
-            w_item.setData(Qt.ItemDataRole.UserRole, str(item.uid))
-            w_item.setData(
-                Qt.ItemDataRole.ToolTipRole,
-                item.text,
-            )
-            self._dialog.ui.search_result.addItem(w_item)
-        self._dialog.ui.search_result.sortItems()
+        search_result = self._dialog.ui.search_result
+        patterns = compile_search(search)
+        # Refilled on every key press, repaint once when all items has been replaced.
+        search_result.setUpdatesEnabled(False)
+        try:
+            search_result.clear()
+            for item in self._doorstop_data.iter_items():
+                if not match_item(item, patterns):
+                    continue
+
+                text = f"[{item}] - {item.header}"
+                w_item = QListWidgetItem(text)
+                w_item.setData(Qt.ItemDataRole.UserRole, str(item.uid))
+                w_item.setData(
+                    Qt.ItemDataRole.ToolTipRole,
+                    item.text,
+                )
+                search_result.addItem(w_item)
+            search_result.sortItems()
+        finally:
+            search_result.setUpdatesEnabled(True)
 
     def _on_accepted_button_pressed(self) -> None:
         selected_items = self._dialog.ui.search_result.selectedItems()
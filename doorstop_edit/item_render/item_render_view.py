@@ -1,4 +1,5 @@
 import enum
+import functools
 import logging
 from pathlib import Path
 from typing import Callable, List, Optional, Tuple, Union
@@ -108,6 +109,11 @@ function focus_item(id) {{
 """
 
 
+@functools.lru_cache(maxsize=1)
+def _empty_page_html() -> str:
+    return HTML_TEMPLATE.format(body="", style=MARKDOWN_CSS)
+
+
 class CustomWebEnginePage(QWebEnginePage):
     """Custom WebEnginePage to customize how we handle link navigation"""
 
@@ -195,8 +201,7 @@ class ItemRenderView(QObject):
 
     def _update(self, item: Optional[doorstop.Item], reload: bool) -> None:
         if item is None:
-            html = HTML_TEMPLATE.format(body="", style=MARKDOWN_CSS)
-            self.web_view.setHtml(html, Path.cwd().as_uri())
+            self.web_view.setHtml(_empty_page_html(), Path.cwd().as_uri())
             return
 
         self.html_select_item.emit(item.uid.value)
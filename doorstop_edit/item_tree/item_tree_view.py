@@ -1,9 +1,9 @@
 import logging
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Pattern, Tuple, Union
 
 import doorstop
 from PySide6.QtCore import QPoint, Qt, Slot
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QLineEdit, QMenu, QTreeWidget, QTreeWidgetItem
 
 from doorstop_edit.app_signals import AppSignals
@@ -16,7 +16,8 @@ from doorstop_edit.item_tree.document_item_level_tree import (
 from doorstop_edit.theme import Theme
 from doorstop_edit.utils.custom_color_item_delegate import CustomColorItemDelegate
 from doorstop_edit.utils.debug_timer import time_function
-from doorstop_edit.utils.item_utils import match_item
+from doorstop_edit.utils.icons import get_icon
+from doorstop_edit.utils.item_utils import compile_search, match_item
 
 logger = logging.getLogger("gui")
 
@@ -47,7 +48,7 @@ class ItemTreeView:
         self._selected_item_uids: List[str] = []
 
         self._filter_show_inactive = False
-        self._filter_search_input: List[str] = []
+        self._filter_search_input: List[Pattern[str]] = []
 
         self._tree_widget.clear()  # Clear demo stuff created in designer.
 
@@ -164,6 +165,14 @@ class ItemTreeView:
 
     @time_function("Updating tree view")
     def _update(self, notify_change: bool = True) -> None:
+        # Repaint once when the whole tree has been replaced.
+        self._tree_widget.setUpdatesEnabled(False)
+        try:
+            self._rebuild_tree(notify_change)
+        finally:
+            self._tree_widget.setUpdatesEnabled(True)
+
+    def _rebuild_tree(self, notify_change: bool) -> None:
         # Always clear selection before insert since it will generate a lot of selection changed
         # otherwise. Does not completely eleminate the "problem" in all cases though. Clear is also
         # wanted when no document selected.
@@ -204,7 +213,7 @@ class ItemTreeView:
 
     def _on_search_input_changed(self, text: str) -> None:
         """Called when search box content changes."""
-        self._filter_search_input = text.split()
+        self._filter_search_input = compile_search(text.split())
         self._update(notify_change=False)
 
     def _on_delete_item_button_clicked(self, item_uid: str) -> None:
@@ -223,7 +232,7 @@ class ItemTreeView:
         menu = QMenu(self._tree_widget)
 
         show_inactive_action = QAction(
-            QIcon(":/icons/file-hidden"),
+            get_icon(":/icons/file-hidden"),
             "Hide Inactive" if self._filter_show_inactive else "Show Inactive",
             self._tree_widget,
         )
@@ -232,21 +241,21 @@ class ItemTreeView:
         show_inactive_action.setChecked(self._filter_show_inactive)
 
         reload_action = QAction(
-            QIcon(":/icons/reload"),
+            get_icon(":/icons/reload"),
             "Reload Tree",
             self._tree_widget,
         )
         reload_action.triggered.connect(self._update)
 
         expand_action = QAction(
-            QIcon(":/icons/unfold-more"),
+            get_icon(":/icons/unfold-more"),
             "Expand All",
             self._tree_widget,
         )
         expand_action.triggered.connect(self._tree_widget.expandAll)
 
         collapse_action = QAction(
-            QIcon(":/icons/unfold-less"),
+            get_icon(":/icons/unfold-less"),
             "Collapse All",
             self._tree_widget,
         )
@@ -257,17 +266,17 @@ class ItemTreeView:
         if w_item is not None:
             item_uid = w_item.data(self.UID_COLUMN, Qt.ItemDataRole.UserRole)
 
-            delete_action = QAction(QIcon(":/icons/trash-can"), "Delete Item", self._tree_widget)
+            delete_action = QAction(get_icon(":/icons/trash-can"), "Delete Item", self._tree_widget)
             delete_action.setCheckable(False)
             delete_action.triggered.connect(
                 lambda checked=False, item_uid=item_uid: self._on_delete_item_button_clicked(item_uid)
             )
 
-            pin_action = QAction(QIcon(":/icons/pin"), "Pin", self._tree_widget)
+            pin_action = QAction(get_icon(":/icons/pin"), "Pin", self._tree_widget)
             pin_action.setCheckable(False)
             pin_action.triggered.connect(lambda checked=False, item_uid=item_uid: self._signals.add_pin.emit(item_uid))
 
-            view_action = QAction(QIcon(":/icons/view-item"), "Popup", self._tree_widget)
+            view_action = QAction(get_icon(":/icons/view-item"), "Popup", self._tree_widget)
             view_action.triggered.connect(
                 lambda checked=False, item_uid=item_uid: self._signals.view_item.emit(item_uid, True)
             )
@@ -276,7 +285,7 @@ class ItemTreeView:
             item_actions.append(pin_action)
             item_actions.append(view_action)
 
-        add_action = QAction(QIcon(":/icons/add-item"), "New Item", self._tree_widget)
+        add_action = QAction(get_icon(":/icons/add-item"), "New Item", self._tree_widget)
         add_action.triggered.connect(lambda checked=False, uid=item_uid: self._signals.add_item.emit(uid))
 
         actions = []
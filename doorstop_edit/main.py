@@ -11,7 +11,6 @@ from PySide6.QtGui import QFontDatabase, QIcon, Qt
 from PySide6.QtWidgets import QApplication, QSplashScreen
 
 from doorstop_edit.application import DoorstopEdit
-from doorstop_edit.utils.version_summary import create_version_summary
 
 logger = logging.getLogger("gui")
 
@@ -41,6 +40,8 @@ def setup(app: QApplication, argv: List[str]) -> Optional[DoorstopEdit]:
     args = parser.parse_args(argv[1:])
 
     if args.version:
+        from doorstop_edit.utils.version_summary import create_version_summary
+
         print(create_version_summary())
         return None
 
@@ -1,6 +1,7 @@
 import os
 import re
 from pathlib import Path
+from typing import Optional
 
 from PySide6.QtCore import QByteArray
 from PySide6.QtGui import QCloseEvent
@@ -27,6 +28,7 @@ class MainWindow(QMainWindow, QtStyleTools):
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
+        self._last_theme_extra: Optional[dict] = None
         self.theme_settings = self.ThemeSettings()
         self.update_theme()
         self._restore_window_state()
@@ -36,9 +38,7 @@ class MainWindow(QMainWindow, QtStyleTools):
         super().closeEvent(event)
 
     def _store_window_state(self) -> None:
-        settings = self.Settings()
-        settings.geometry = self.saveGeometry()
-        settings.state = self.saveState()
+        self.Settings().bulk_set(geometry=self.saveGeometry(), state=self.saveState())
 
     def _restore_window_state(self) -> None:
         settings = self.Settings()
@@ -75,6 +75,14 @@ class MainWindow(QMainWindow, QtStyleTools):
             # Density Scale
             "density_scale": self.theme_settings.density_scale,
         }
-        self.apply_stylesheet(self, theme="dark_teal.xml", extra=extra)
-        self.setStyleSheet(self.styleSheet() + self._load_custom_css())
+        if extra == self._last_theme_extra:
+            return  # Nothing changed, avoid expensive stylesheet rebuild.
+        # The style sheet is set twice (theme, then theme + custom css), repaint the window only once.
+        self.setUpdatesEnabled(False)
+        try:
+            self.apply_stylesheet(self, theme="dark_teal.xml", extra=extra)
+            self.setStyleSheet(self.styleSheet() + self._load_custom_css())
+        finally:
+            self.setUpdatesEnabled(True)
         setup_colors(extra)
+        self._last_theme_extra = extra
@@ -1,11 +1,12 @@
 import logging
 
 from PySide6.QtCore import QPoint, Qt, Slot
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QListWidget, QListWidgetItem, QMenu
 
 from doorstop_edit.app_signals import AppSignals
 from doorstop_edit.doorstop_data import DoorstopData
+from doorstop_edit.utils.icons import get_icon
 
 logger = logging.getLogger("gui")
 
@@ -30,9 +31,14 @@ class PinnedItemsView:
         self._list_widget.addItem(w_item)
 
     def _remove_selected(self) -> None:
-        selected = self._list_widget.selectedItems()
-        for s in selected:
-            self._list_widget.takeItem(self._list_widget.row(s))
+        # Take from highest row first so that the remaining rows are not shifted.
+        rows = sorted((self._list_widget.row(s) for s in self._list_widget.selectedItems()), reverse=True)
+        self._list_widget.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                self._list_widget.takeItem(row)
+        finally:
+            self._list_widget.setUpdatesEnabled(True)
 
     def _on_item_clicked(self, _: bool) -> None:
         selected_items = self._list_widget.selectedItems()
@@ -48,11 +54,11 @@ class PinnedItemsView:
         actions = []
 
         if w_item is not None:
-            remove_action = QAction(QIcon(":/icons/unpin"), "Unpin", self._list_widget)
+            remove_action = QAction(get_icon(":/icons/unpin"), "Unpin", self._list_widget)
             remove_action.triggered.connect(self._remove_selected)
             actions.append(remove_action)
 
-            view_action = QAction(QIcon(":/icons/view-item"), "Popup", self._list_widget)
+            view_action = QAction(get_icon(":/icons/view-item"), "Popup", self._list_widget)
             view_action.triggered.connect(
                 lambda checked=False, item_uid=w_item.data(Qt.ItemDataRole.UserRole): self._signals.view_item.emit(
                     item_uid, True
@@ -5,6 +5,14 @@ from PySide6.QtCore import QSettings
 
 logger = logging.getLogger("settings")
 
+# Attributes of `PersistentSetting` that are not settings, in addition to private attributes and
+# methods (see `_is_setting`).
+_NON_PERSISTENT_ATTRIBUTES = ("settings", "IN_GROUP")
+
+
+def _is_setting(name: str, class_attr: Any) -> bool:
+    return not name.startswith("_") and name not in _NON_PERSISTENT_ATTRIBUTES and not callable(class_attr)
+
 
 def get_settings() -> QSettings:
     """Get a application QSettings instance.
@@ -29,7 +37,7 @@ class PersistentSetting(object):
     be saved to.
 
     An attribute is only save to disk when modified, untouched default attributes will not be save
-    to disk.
+    to disk. Setting an attribute to the value it already has on disk is a no-op.
 
     Example:
 
@@ -48,22 +56,39 @@ class PersistentSetting(object):
         self.settings = get_settings()
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name in ["settings", "IN_GROUP"]:
+        if not _is_setting(name, getattr(type(self), name, None)):
             super().__setattr__(name, value)
             return
         self.settings.beginGroup(self.IN_GROUP)
-        if super().__getattribute__(name) == value:
+        self._store(name, value)
+        self.settings.endGroup()
+
+    def bulk_set(self, **kwargs: Any) -> None:
+        """Set multiple settings while only entering the setting group once."""
+        self.settings.beginGroup(self.IN_GROUP)
+        for name, value in kwargs.items():
+            self._store(name, value)
+        self.settings.endGroup()
+
+    def _store(self, name: str, value: Any) -> None:
+        """Write setting to disk if it differs from the value on disk, setting group must already be
+        entered.
+
+        The value on disk is compared (not a value remembered by this instance) since other instances
+        and processes may write the same setting.
+        """
+        default = super().__getattribute__(name)
+        if default == value:
             # If default value is set, remove from disk. This makes users follow changed default
             # behaviours better.
-            self.settings.remove(name)
-        else:
+            if self.settings.contains(name):
+                self.settings.remove(name)
+        elif self.settings.value(name, default, type(default)) != value:
             self.settings.setValue(name, value)
 
-        self.settings.endGroup()
-
     def __getattribute__(self, name: str) -> Any:
         default = super().__getattribute__(name)
-        if name in ["settings", "IN_GROUP"]:
+        if not _is_setting(name, default):
             return default
         self.settings.beginGroup(self.IN_GROUP)
         val = self.settings.value(name, default, type(default))
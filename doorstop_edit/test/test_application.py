@@ -14,22 +14,6 @@ from doorstop_edit.dialogs import ConfirmDialog, InfoDialog
 from doorstop_edit.ui_gen.ui_main import Ui_MainWindow
 
 
-@pytest.fixture(scope="session")
-def app_session(tree_root: Path) -> Iterator[DoorstopEdit]:
-    """Create DoorstopEdit
-
-    Created only once per session since QApplcation cannot be recreated reliably in a process, thus
-    it is hard to recreate DoorstopEdit for each test.
-
-    When DoorstopEdit is recreate QApplication still have references to the old instance which cause
-    troubles.
-    """
-    app = DoorstopEdit(tree_root)
-    app.start()  # Must show it, clicks wont work otherwise.
-    yield app
-    app.quit()
-
-
 @pytest.fixture()
 def app(
     app_session: DoorstopEdit, tree_root: Path, monkeypatch: pytest.MonkeyPatch, qtbot: QtBot
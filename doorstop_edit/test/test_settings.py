@@ -0,0 +1,105 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from doorstop_edit.conftest import QSettingsMock
+from doorstop_edit.settings import PersistentSetting
+
+
+class QSettingsStoreMock(QSettingsMock):
+    """QSettings mock backed by a dict shared by all instances, like a settings file."""
+
+    def __init__(self, store: Dict[str, Any], writes: List[str]) -> None:
+        super().__init__()
+        self._store = store
+        self._writes = writes
+        self._group = ""
+
+    def _key(self, name: str) -> str:
+        return self._group + "/" + name
+
+    def value(self, name: Any, default_val: Any, type: Any) -> Any:
+        return self._store.get(self._key(name), default_val)
+
+    def contains(self, name: Any) -> bool:
+        return self._key(name) in self._store
+
+    def beginGroup(self, val: str) -> None:
+        self._group = val
+
+    def endGroup(self) -> None:
+        self._group = ""
+
+    def setValue(self, name: Any, value: Any) -> None:
+        self._writes.append(self._key(name))
+        self._store[self._key(name)] = value
+
+    def remove(self, name: Any) -> None:
+        self._writes.append(self._key(name))
+        del self._store[self._key(name)]
+
+
+class SampleSettings(PersistentSetting):
+    IN_GROUP = "Sample"
+    font_size = 12
+    name = "Default"
+
+    def helper(self) -> int:
+        return self.font_size * 2
+
+
+@pytest.fixture()
+def store() -> Dict[str, Any]:
+    return {}
+
+
+@pytest.fixture()
+def writes(store: Dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    writes: List[str] = []
+    monkeypatch.setattr("doorstop_edit.settings.get_settings", lambda: QSettingsStoreMock(store, writes))
+    return writes
+
+
+def test_write_only_when_changed(store: Dict[str, Any], writes: List[str]) -> None:
+    settings = SampleSettings()
+
+    settings.font_size = 14
+    settings.font_size = 14
+    settings.bulk_set(font_size=14, name="Default")
+
+    assert store == {"Sample/font_size": 14}
+    assert writes == ["Sample/font_size"]
+
+
+def test_default_value_removed(store: Dict[str, Any], writes: List[str]) -> None:
+    settings = SampleSettings()
+
+    settings.font_size = 14
+    settings.font_size = 12
+
+    assert store == {}
+    assert settings.font_size == 12
+
+
+def test_write_not_skipped_when_changed_by_other_instance(store: Dict[str, Any], writes: List[str]) -> None:
+    first = SampleSettings()
+    second = SampleSettings()
+
+    first.font_size = 14
+    second.font_size = 16
+    first.font_size = 14
+
+    assert store == {"Sample/font_size": 14}
+    assert first.font_size == 14
+    assert second.font_size == 14
+
+
+def test_private_attributes_and_methods_not_settings(store: Dict[str, Any], writes: List[str]) -> None:
+    settings = SampleSettings()
+
+    settings._private = 1
+    settings.font_size = 14
+
+    assert settings._private == 1
+    assert settings.helper() == 28
+    assert store == {"Sample/font_size": 14}
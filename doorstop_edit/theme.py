@@ -23,20 +23,28 @@ class Theme:
 def _to_color(val: Optional[str]) -> QColor:
     if val is None:
         raise RuntimeError("Color is None")
-    if val.startswith("#"):
-        return QColor(int(val[1:], base=16))
-    raise RuntimeError(f"Unsupported color value {val}")
+    color = QColor(val)
+    if not color.isValid():
+        raise RuntimeError(f"Unsupported color value {val}")
+    return color
 
 
-def setup_colors(stylesheet_extra: dict) -> None:
+# Theme attributes set from colors exported by qt_material when applying the stylesheet.
+_QTMATERIAL_COLORS = (
+    ("PRIMARY_COLOR", "QTMATERIAL_PRIMARYCOLOR"),
+    ("PRIMARY_LIGHT_COLOR", "QTMATERIAL_PRIMARYLIGHTCOLOR"),
+    ("SECONDARY_COLOR", "QTMATERIAL_SECONDARYCOLOR"),
+    ("SECONDARY_LIGHT_COLOR", "QTMATERIAL_SECONDARYLIGHTCOLOR"),
+    ("SECONDARY_DARK_COLOR", "QTMATERIAL_SECONDARYDARKCOLOR"),
+    ("PRIMARY_TEXT_COLOR", "QTMATERIAL_PRIMARYTEXTCOLOR"),
+    ("SECONDARY_TEXT_COLOR", "QTMATERIAL_SECONDARYTEXTCOLOR"),
+)
+
 
-    Theme.PRIMARY_COLOR = _to_color(os.environ.get("QTMATERIAL_PRIMARYCOLOR"))
-    Theme.PRIMARY_LIGHT_COLOR = _to_color(os.environ.get("QTMATERIAL_PRIMARYLIGHTCOLOR"))
-    Theme.SECONDARY_COLOR = _to_color(os.environ.get("QTMATERIAL_SECONDARYCOLOR"))
-    Theme.SECONDARY_LIGHT_COLOR = _to_color(os.environ.get("QTMATERIAL_SECONDARYLIGHTCOLOR"))
-    Theme.SECONDARY_DARK_COLOR = _to_color(os.environ.get("QTMATERIAL_SECONDARYDARKCOLOR"))
-    Theme.PRIMARY_TEXT_COLOR = _to_color(os.environ.get("QTMATERIAL_PRIMARYTEXTCOLOR"))
-    Theme.SECONDARY_TEXT_COLOR = _to_color(os.environ.get("QTMATERIAL_SECONDARYTEXTCOLOR"))
+def setup_colors(stylesheet_extra: dict) -> None:
+    environ = os.environ
+    for attr, env_key in _QTMATERIAL_COLORS:
+        setattr(Theme, attr, _to_color(environ.get(env_key)))
     Theme.SUCCESS_COLOR = _to_color(stylesheet_extra["success"])
     Theme.WARNING_COLOR = _to_color(stylesheet_extra["warning"])
     Theme.DANGER_COLOR = _to_color(stylesheet_extra["danger"])
@@ -1,8 +1,8 @@
 import logging
-from typing import Union
+from typing import Dict, Optional, Union
 
 from PySide6.QtCore import QModelIndex, QObject, QPersistentModelIndex, QRect, Qt
-from PySide6.QtGui import QBrush, QColor, QPainter, QPen
+from PySide6.QtGui import QBrush, QColor, QFont, QFontMetrics, QPainter, QPen
 from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
 
 from doorstop_edit.theme import Theme
@@ -52,6 +52,49 @@ class CustomColorItemDelegate(QStyledItemDelegate):
         self.linePen.setWidth(2)
         # Alignment
         self.alignment_flag = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+        # Brushes and pens for item specific colors, keyed by rgba to avoid allocations on paint.
+        self._brush_cache: Dict[int, QBrush] = {}
+        self._pen_cache: Dict[int, QPen] = {}
+        # Styled fonts keyed by font style, valid as long as the painter font is unchanged (see
+        # `_update_font_base`, which also updates the text indent).
+        self._font_cache: Dict[str, QFont] = {}
+        self._font_cache_base: Optional[QFont] = None
+        self._text_offset_px = 0
+
+    def _get_brush(self, color: QColor) -> QBrush:
+        key = color.rgba()
+        brush = self._brush_cache.get(key)
+        if brush is None:
+            brush = QBrush(color)
+            self._brush_cache[key] = brush
+        return brush
+
+    def _get_pen(self, color: QColor) -> QPen:
+        key = color.rgba()
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            pen = QPen(color)
+            self._pen_cache[key] = pen
+        return pen
+
+    def _update_font_base(self, base: QFont) -> None:
+        if base != self._font_cache_base:
+            self._font_cache.clear()
+            self._font_cache_base = base
+            self._text_offset_px = QFontMetrics(base).horizontalAdvance(" " * 6)
+
+    def _get_font(self, base: QFont, font_style: str) -> QFont:
+        font = self._font_cache.get(font_style)
+        if font is None:
+            font = QFont(base)
+            if "b" in font_style:
+                font.setBold(True)
+            if "i" in font_style:
+                font.setItalic(True)
+            if "u" in font_style:
+                font.setUnderline(True)
+            self._font_cache[font_style] = font
+        return font
 
     def paint(
         self,
@@ -60,27 +103,26 @@ class CustomColorItemDelegate(QStyledItemDelegate):
         index: Union[QModelIndex, QPersistentModelIndex],
     ) -> None:
 
-        # Parse out colors from item
+        # Parse out colors from item, default style (None) is the common case and skips parsing.
         style_data = index.model().data(index, self.STYLED_ITEM_ROLE)
         bg_brush = self.default_background_brush
         fg_pin = self.default_textpen
         font_style = ""
         if style_data is not None:
             if isinstance(style_data, QColor):
-                bg_brush = QBrush(style_data)
+                bg_brush = self._get_brush(style_data)
             elif isinstance(style_data, tuple):
                 if isinstance(style_data[0], QColor):
-                    bg_brush = QBrush(style_data[0])
+                    bg_brush = self._get_brush(style_data[0])
                 if len(style_data) > 1 and isinstance(style_data[1], QColor):
-                    fg_pin = QPen(style_data[1])
+                    fg_pin = self._get_pen(style_data[1])
                 if len(style_data) > 2 and isinstance(style_data[2], str):
                     font_style = style_data[2].lower()
 
         text = index.model().data(index, Qt.ItemDataRole.DisplayRole)
         item_state: QStyle.StateFlag = option.state  # type: ignore
         rect: QRect = option.rect  # type: ignore
-        select_mark_rect = QRect(rect.left(), rect.top(), 10, rect.height())
-        item_rect = rect.adjusted(self.offset, self.offset, -self.offset, -self.offset)
+        item_rect = rect.adjusted(self.offset, self.offset, -self.offset, -self.offset) if self.offset else rect
 
         painter.save()
         # paint background
@@ -89,19 +131,20 @@ class CustomColorItemDelegate(QStyledItemDelegate):
         if item_state & QStyle.StateFlag.State_Selected:
             painter.fillRect(item_rect, self.selected_bg_brush)
             if index.column() == 0:
+                select_mark_rect = QRect(rect.left(), rect.top(), 10, rect.height())
                 painter.fillRect(select_mark_rect, self.selected_brush)
 
         # paint text
         painter.setPen(fg_pin)
-        font = painter.font()
-        if "b" in font_style:
-            font.setBold(True)
-        if "i" in font_style:
-            font.setItalic(True)
-        if "u" in font_style:
-            font.setUnderline(True)
-        painter.setFont(font)
-        painter.drawText(item_rect, self.alignment_flag, (" " * 6) + text)
+        base_font = painter.font()
+        self._update_font_base(base_font)
+        if font_style:
+            painter.setFont(self._get_font(base_font, font_style))
+        # Indent by moving the rect instead of prefixing the text with spaces. Adjusted in place and
+        # restored to not allocate a new rect for every paint.
+        item_rect.adjust(self._text_offset_px, 0, 0, 0)
+        painter.drawText(item_rect, self.alignment_flag, text)
+        item_rect.adjust(-self._text_offset_px, 0, 0, 0)
 
         if self.paint_border:
             # paint bottom border
@@ -1,3 +1,4 @@
+import functools
 import logging
 import threading
 import time
@@ -7,14 +8,20 @@ logger = logging.getLogger("gui")
 
 
 def time_function(msg: str) -> Callable:
-    """Decorator for timing function."""
+    """Decorator for timing function.
+
+    Timing is only done when debug logging is enabled.
+    """
 
     def wrapper(func: Callable) -> Callable:
+        @functools.wraps(func)
         def decorated(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            if not logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
+            start_time = time.perf_counter_ns()
             retval = func(*args, **kwargs)
-            duration = time.time() - start_time
-            logger.debug("%s took %.3f s, thread: %s", msg, duration, threading.get_native_id())
+            duration_ms = (time.perf_counter_ns() - start_time) / 1e6
+            logger.debug("%s took %.3f ms, thread: %s", msg, duration_ms, threading.get_native_id())
             return retval
 
         return decorated
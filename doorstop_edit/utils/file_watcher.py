@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import Callable, List
+from typing import Callable, Dict, List
 
 from doorstop import Document
+from PySide6.QtCore import QObject, Qt, QTimer, Signal, Slot
 from watchdog.events import (
     FileCreatedEvent,
     FileDeletedEvent,
@@ -10,14 +11,69 @@ from watchdog.events import (
     FileSystemEventHandler,
 )
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+
+
+class _EventCoalescer(QObject):
+    """Collects file events on the thread owning this object (the GUI thread) and calls `callback`
+    when no new events have arrived for `delay_ms`."""
+
+    # Emitted from the observer thread, delivered queued to the owning thread.
+    event_received = Signal(bool, str)
+
+    def __init__(self, callback: Callable[[bool, str], None], delay_ms: int) -> None:
+        super().__init__()
+        self._callback = callback
+        self._pending: Dict[str, bool] = {}  # File name -> modified only.
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._flush)
+        self.event_received.connect(self._on_event_received, Qt.ConnectionType.QueuedConnection)
+
+    @Slot(bool, str)
+    def _on_event_received(self, modified_only: bool, filename: str) -> None:
+        # Only a modification if all events for the file were modifications.
+        self._pending[filename] = self._pending.get(filename, True) and modified_only
+        self._timer.start()
+
+    def _flush(self) -> None:
+        pending = self._pending
+        self._pending = {}
+        structural = [filename for filename, modified_only in pending.items() if not modified_only]
+        if len(structural) > 0:
+            # Files were created, deleted or moved. The whole tree is rebuilt which also reloads
+            # all modified files, notify only once.
+            self._callback(False, structural[0])
+            return
+        for filename in pending:
+            self._callback(True, filename)
+
+    def clear(self) -> None:
+        self._timer.stop()
+        self._pending.clear()
 
 
 class FileWatcher(FileSystemEventHandler):
-    def __init__(self, on_dir_changed: Callable[[bool, str], None]) -> None:
+    """Watch document directories and call `on_dir_changed(modified_only, filename)` on changes.
+
+    A single save often generates a burst of events. Events are collected until none has arrived
+    for `COALESCE_TIME_MS` and then `on_dir_changed` is called once per modified file, or only once
+    if any file was created, deleted or moved. `on_dir_changed` is always called from the thread
+    that created the watcher (the GUI thread), one call at a time.
+
+    A single native observer (inotify, FSEvents etc.) is shared for all documents. Set `use_polling`
+    for file systems where native events are unavailable or slow (e.g. network shares).
+    """
+
+    COALESCE_TIME_MS = 50
+
+    def __init__(self, on_dir_changed: Callable[[bool, str], None], use_polling: bool = False) -> None:
         self.on_dir_changed = on_dir_changed
-        self.observer = Observer()
+        self.observer = PollingObserver() if use_polling else Observer()
         # self.observer.start()
         self.scheduled_docs: List[Document] = []
+        self._coalescer = _EventCoalescer(on_dir_changed, self.COALESCE_TIME_MS)
 
     def start(self) -> None:
         self.observer.start()
@@ -26,6 +82,7 @@ class FileWatcher(FileSystemEventHandler):
         if self.observer.is_alive():
             self.observer.stop()
             self.observer.join(timeout=5)
+        self._coalescer.clear()
 
     def pause(self) -> None:
         self.observer.unschedule_all()
@@ -43,17 +100,17 @@ class FileWatcher(FileSystemEventHandler):
     def on_moved(self, event: FileMovedEvent) -> None:
         super().on_moved(event)
 
-        self.on_dir_changed(False, Path(event.src_path).name)
+        self._coalescer.event_received.emit(False, Path(event.src_path).name)
 
     def on_created(self, event: FileCreatedEvent) -> None:
         super().on_created(event)
 
-        self.on_dir_changed(False, Path(event.src_path).name)
+        self._coalescer.event_received.emit(False, Path(event.src_path).name)
 
     def on_deleted(self, event: FileDeletedEvent) -> None:
         super().on_deleted(event)
 
-        self.on_dir_changed(False, Path(event.src_path).name)
+        self._coalescer.event_received.emit(False, Path(event.src_path).name)
 
     def on_modified(self, event: FileModifiedEvent) -> None:
         super().on_modified(event)
@@ -61,4 +118,4 @@ class FileWatcher(FileSystemEventHandler):
             # Dont care.
             return
 
-        self.on_dir_changed(True, Path(event.src_path).name)
+        self._coalescer.event_received.emit(True, Path(event.src_path).name)
@@ -0,0 +1,17 @@
+from typing import Dict
+
+from PySide6.QtGui import QIcon
+
+_ICON_CACHE: Dict[str, QIcon] = {}
+
+
+def get_icon(path: str) -> QIcon:
+    """Get icon from resource path, only looked up in the resource system once.
+
+    QIcon is implicitly shared so the same instance can be used by any number of widgets/actions.
+    """
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = QIcon(path)
+        _ICON_CACHE[path] = icon
+    return icon
@@ -1,41 +1,45 @@
+import functools
 import re
-from typing import List, Union
+from typing import List, Pattern, Tuple, Union
 
 import doorstop
 from doorstop.core.types import Level as doorstop_Level
 
 
-def match_item(item: doorstop.Item, search: List[str]) -> bool:
-    result: List[bool] = []
-    for term in search:
-        pattern = re.compile(re.escape(term), re.IGNORECASE)
-        found = False
-        if item.header is not None and pattern.search(item.header):
-            found = True
-        elif pattern.search(str(item.uid)):
-            found = True
-        elif pattern.search(item.text):
-            found = True
-        elif pattern.search(str(item.level)):
-            found = True
-        result.append(found)
-    return all(result)
+def compile_search(search: List[str]) -> List[Pattern[str]]:
+    """Compile search terms into case insensitive patterns for `match_item`."""
+    return [re.compile(re.escape(term), re.IGNORECASE) for term in search]
 
 
-def match_level(item: doorstop.Item, level: Union[str, doorstop_Level], include_parent: bool = False) -> bool:
-    """Returns True if `item` is on the same level as `level`."""
+def match_item(item: doorstop.Item, search: List[Pattern[str]]) -> bool:
+    """Returns True if all search patterns (see `compile_search`) is found in `item`."""
+    if len(search) == 0:
+        return True
+    header = item.header
+    uid = str(item.uid)
+    text = item.text
+    level = str(item.level)
+    for pattern in search:
+        if header is not None and pattern.search(header):
+            continue
+        if pattern.search(uid) or pattern.search(text) or pattern.search(level):
+            continue
+        return False
+    return True
 
-    def level_to_parts(_level: str) -> List[int]:
-        parts = [int(part) for part in str(_level).split(".")]
-        if parts[-1] == 0:
-            parts = parts[:-1]
-        return parts
 
-    if isinstance(level, doorstop_Level):
-        level = str(level)
+@functools.lru_cache(maxsize=4096)
+def _level_to_parts(level: str) -> Tuple[int, ...]:
+    parts = tuple(int(part) for part in level.split("."))
+    if parts[-1] == 0:
+        parts = parts[:-1]
+    return parts
 
-    item_level_parts = level_to_parts(item.level)
-    level_parts = level_to_parts(level)
+
+def match_level(item: doorstop.Item, level: Union[str, doorstop_Level], include_parent: bool = False) -> bool:
+    """Returns True if `item` is on the same level as `level`."""
+    item_level_parts = _level_to_parts(str(item.level))
+    level_parts = _level_to_parts(str(level))
     if include_parent:
         if len(item_level_parts) == len(level_parts) - 1 and item_level_parts == level_parts[:-1]:
             return True
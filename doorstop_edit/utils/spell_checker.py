@@ -1,5 +1,6 @@
+import functools
 import re
-from typing import Optional
+from typing import FrozenSet, Tuple
 
 from PySide6.QtCore import QRegularExpression, Qt
 from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QTextDocument
@@ -7,6 +8,52 @@ from spellchecker import SpellChecker
 
 from doorstop_edit.settings import PersistentSetting
 
+# Whitespace separated words with leading and trailing non-word characters (e.g. comma or dot)
+# removed. Words shorter than two characters or with brackets inside are ignored.
+_WORD_RE = re.compile(r"(?<!\S)[^\w\s]*(\w[^\s\[\]]*\w)[^\w\s]*(?!\S)")
+
+
+@functools.lru_cache(maxsize=8)
+def _make_spell(language: str) -> SpellChecker:
+    """Get spell checker for language, shared between all highlighters since the dictionary is
+    expensive to load."""
+    return SpellChecker(language=language)
+
+
+@functools.lru_cache(maxsize=256)
+def _unknown_words_expression(words: FrozenSet[str]) -> QRegularExpression:
+    """Build a single expression matching any of the words.
+
+    Search occurences of unknown word that stands alone (not a substring). Non-word characters in
+    matching words are disregarded. Lookarounds are used so that the separating character is not
+    consumed, which would otherwise hide a directly following unknown word.
+
+        "ointm" should not match "ointm" in appointment
+        "asdasd" should match "asdasd" in "asdasd."
+    """
+    alternatives = "|".join(QRegularExpression.escape(w) for w in sorted(words))
+    return QRegularExpression(rf"(?<!\w)({alternatives})(?!\w)")
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_unknown_words(text: str, language: str) -> Tuple[Tuple[int, int], ...]:
+    """Get start position and length of all unknown words in text.
+
+    Cached since blocks are re-highlighted on every edit even though most of them are unchanged.
+    """
+    spell = _make_spell(language)
+
+    word_list = _WORD_RE.findall(text)
+    unknown = spell.unknown(word_list)
+
+    spans = []
+    if len(unknown) > 0:
+        i = _unknown_words_expression(frozenset(unknown)).globalMatch(text)
+        while i.hasNext():
+            match = i.next()
+            spans.append((match.capturedStart(1), match.capturedLength(1)))
+    return tuple(spans)
+
 
 class TextEditSpellChecker(QSyntaxHighlighter):
     class Settings(PersistentSetting):
@@ -17,45 +64,14 @@ class TextEditSpellChecker(QSyntaxHighlighter):
     def __init__(self, parent: QTextDocument):
         super().__init__(parent)
         self._setting = self.Settings()
-        self._language = self._setting.langugage
-        self._spell: Optional[SpellChecker] = None
-
-    def _get_spellchecker(self) -> SpellChecker:
-        if self._spell is None or self._language != self._setting.langugage:
-            self._spell = SpellChecker(language=self._setting.langugage)
-            self._language = self._setting.langugage
-        return self._spell
 
     def highlightBlock(self, text: str) -> None:
         if not self._setting.enabled:
             return
 
-        spell = self._get_spellchecker()
-
-        word_list = []
-        for w in text.split():
-            # Remove all leading and trailing non-word characters (e.g. comma or dot).
-            new = re.sub(r"^\W+|\W+$", "", w)
-            if "[" in new or "]" in new:
-                continue
-
-            if len(new) > 1:
-                word_list.append(new)
-
-        unknown = spell.unknown(word_list)
-
         myClassFormat = QTextCharFormat()
         myClassFormat.setUnderlineStyle(QTextCharFormat.UnderlineStyle.WaveUnderline)
         myClassFormat.setUnderlineColor(Qt.GlobalColor.red)
 
-        for w in unknown:
-            # Search occurences of unknown word that stands alone (not a substring).
-            # Non-word characters in matching words are disregarded.
-            #
-            # "ointm" should not match "ointm" in appointment
-            # "asdasd" should match "asdasd" in "asdasd."
-            expression = QRegularExpression(rf"(?:^|[^\w])({w})(?:$|[^\w])")
-            i = expression.globalMatch(text)
-            while i.hasNext():
-                match = i.next()
-                self.setFormat(match.capturedStart(1), match.capturedLength(1), myClassFormat)
+        for start, length in _find_unknown_words(text, self._setting.langugage):
+            self.setFormat(start, length, myClassFormat)
@@ -0,0 +1,61 @@
+from typing import List, Tuple
+
+import pytest
+from pytestqt.qtbot import QtBot
+from watchdog.events import (
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+)
+
+from doorstop_edit.utils.file_watcher import FileWatcher
+
+Calls = List[Tuple[bool, str]]
+
+
+@pytest.fixture()
+def calls() -> Calls:
+    return []
+
+
+@pytest.fixture()
+def watcher(qtbot: QtBot, calls: Calls) -> FileWatcher:
+    return FileWatcher(lambda modified_only, filename: calls.append((modified_only, filename)))
+
+
+def wait_for_flush(qtbot: QtBot, calls: Calls) -> None:
+    qtbot.waitUntil(lambda: len(calls) > 0)
+    qtbot.wait(3 * FileWatcher.COALESCE_TIME_MS)  # Make sure nothing more arrives.
+
+
+def test_modifications_coalesced_per_file(qtbot: QtBot, watcher: FileWatcher, calls: Calls) -> None:
+    for _ in range(3):
+        watcher.on_modified(FileModifiedEvent("/docs/REQ/REQ-001.yml"))
+        watcher.on_modified(FileModifiedEvent("/docs/REQ/REQ-002.yml"))
+
+    wait_for_flush(qtbot, calls)
+
+    assert sorted(calls) == [(True, "REQ-001.yml"), (True, "REQ-002.yml")]
+
+
+def test_structural_changes_coalesced_to_single_call(qtbot: QtBot, watcher: FileWatcher, calls: Calls) -> None:
+    watcher.on_modified(FileModifiedEvent("/docs/REQ/REQ-001.yml"))
+    watcher.on_created(FileCreatedEvent("/docs/REQ/REQ-002.yml"))
+    watcher.on_deleted(FileDeletedEvent("/docs/REQ/REQ-003.yml"))
+    watcher.on_moved(FileMovedEvent("/docs/REQ/REQ-004.yml", "/docs/REQ/REQ-005.yml"))
+    watcher.on_modified(FileModifiedEvent("/docs/REQ/REQ-006.yml"))
+
+    wait_for_flush(qtbot, calls)
+
+    assert calls == [(False, "REQ-002.yml")]
+
+
+def test_stop_drops_pending_events(qtbot: QtBot, watcher: FileWatcher, calls: Calls) -> None:
+    watcher.on_created(FileCreatedEvent("/docs/REQ/REQ-001.yml"))
+    qtbot.wait(10)  # Deliver the queued event, shorter than the coalescing time.
+    watcher.stop()
+
+    qtbot.wait(3 * FileWatcher.COALESCE_TIME_MS)
+
+    assert calls == []
@@ -0,0 +1,50 @@
+from tempfile import TemporaryDirectory
+from typing import Iterator
+
+import doorstop
+import pytest
+
+from doorstop_edit.utils.item_utils import _level_to_parts, compile_search, match_item
+
+
+@pytest.fixture()
+def item() -> Iterator[doorstop.Item]:
+    with TemporaryDirectory() as temp_dir:
+        tree = doorstop.Tree(None, root=temp_dir)
+        document = tree.create_document(value="REQ", path=temp_dir + "/REQ", digits=3, sep="-")
+        item = document.add_item(number=None, level="1.2", reorder=False)
+        item.header = "Power Supply"
+        item.text = "Voltage shall be 3.3 V (+/- 5%)."
+        yield item
+
+
+def test_match_empty_search(item: doorstop.Item) -> None:
+    assert match_item(item, compile_search([]))
+
+
+def test_match_all_terms(item: doorstop.Item) -> None:
+    assert match_item(item, compile_search(["power", "voltage"]))
+    assert match_item(item, compile_search(["REQ-001", "1.2"]))
+    assert not match_item(item, compile_search(["power", "current"]))
+
+
+def test_match_case_insensitive(item: doorstop.Item) -> None:
+    assert match_item(item, compile_search(["POWER", "supply"]))
+
+
+def test_match_regex_metacharacters_literally(item: doorstop.Item) -> None:
+    assert match_item(item, compile_search(["(+/-", "5%)."]))
+    assert match_item(item, compile_search(["3.3"]))
+    assert not match_item(item, compile_search(["3x3"]))
+    assert not match_item(item, compile_search([".*"]))
+
+
+def test_level_to_parts() -> None:
+    assert _level_to_parts("1") == (1,)
+    assert _level_to_parts("1.0") == (1,)
+    assert _level_to_parts("1.2.0") == (1, 2)
+    assert _level_to_parts("1.2.3") == (1, 2, 3)
+
+    # Parts compare numerically, giving document order.
+    levels = ["2.0", "1.10", "1.2.1", "1.0", "1.2"]
+    assert sorted(levels, key=_level_to_parts) == ["1.0", "1.2", "1.2.1", "1.10", "2.0"]
@@ -0,0 +1,14 @@
+import functools
+from typing import Optional
+
+from PySide6.QtCore import QCoreApplication
+
+
+@functools.lru_cache(maxsize=None)
+def translate(context: str, source: str, disambiguation: Optional[str] = None, n: int = -1) -> str:
+    """Cached `QCoreApplication.translate`.
+
+    Used by the generated UI code (see tools/gen_ui.py) which translates the same strings every time
+    a window or dialog is created. Call `translate.cache_clear()` if translators are changed.
+    """
+    return QCoreApplication.translate(context, source, disambiguation, n)
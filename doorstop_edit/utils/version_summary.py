@@ -1,3 +1,4 @@
+import functools
 import platform
 import sys
 
@@ -8,6 +9,7 @@ import doorstop_edit
 from doorstop_edit import build_info
 
 
+@functools.lru_cache(maxsize=1)
 def create_version_summary() -> str:
     return f"""\
 Version: {doorstop_edit.__version__}
@@ -1,7 +1,12 @@
 import argparse
+import functools
+import multiprocessing
+import os
+import re
 import shutil
+import string
 from pathlib import Path
-from typing import Generator, List, Tuple
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 REPO_ROOT = Path(__file__).parent.parent
 
@@ -64,6 +69,49 @@ text: |
 {text5}
 """
 
+
+def compile_template(template: str) -> Callable[..., List[bytes]]:
+    """Parse a `str.format` template once into a function rendering it from keyword arguments.
+
+    The result is a list of UTF-8 encoded chunks suitable for `write_chunks`. Values already given
+    as bytes are passed through as-is.
+    """
+    parts = [(literal.encode("utf-8"), field) for literal, field, _, _ in string.Formatter().parse(template)]
+
+    def render(**values: Any) -> List[bytes]:
+        chunks = []
+        for literal, field in parts:
+            if literal != b"":
+                chunks.append(literal)
+            if field is not None:
+                value = values[field]
+                chunks.append(value if isinstance(value, bytes) else str(value).encode("utf-8"))
+        return chunks
+
+    return render
+
+
+def write_chunks(path: Union[Path, str], chunks: List[bytes], dir_fd: Optional[int] = None) -> None:
+    """Write chunks to file, using a single gather-write (writev) where supported.
+
+    If `dir_fd` is given, `path` is relative to that directory.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666, dir_fd=dir_fd)
+    try:
+        written = os.writev(fd, chunks) if hasattr(os, "writev") else 0
+        if written < sum(map(len, chunks)):
+            remaining = memoryview(b"".join(chunks))[written:]
+            while len(remaining) > 0:
+                remaining = remaining[os.write(fd, remaining) :]
+            remaining.release()
+    finally:
+        os.close(fd)
+
+
+_render_dot_doorstop = compile_template(DOT_DOORSTOP_TEMPLATE)
+_render_item = compile_template(ITEM_TEMPLATE)
+
 LEVELS: List[Tuple[str, ...]] = [
     ("1.0", "1.0-7", "1-14"),
     ("2.0", "1-14"),
@@ -76,48 +124,53 @@ LEVELS: List[Tuple[str, ...]] = [
 ]
 
 
-def get_word_list() -> List[str]:
+@functools.lru_cache(maxsize=1)
+def get_word_list() -> List[bytes]:
+    # Words are ASCII, keep them as bytes since they only end up in encoded output anyway.
     word_file = Path(__file__).parent / "wordlist.10000"
-    return word_file.read_text("utf-8").splitlines()
+    return word_file.read_bytes().splitlines()
 
 
 class LevelIterator:
     def __init__(self, total_count: int) -> None:
         self.total_count = total_count
 
+    _LEVEL_RE = re.compile(r"(\d+)(\.0)?")
+    _INTERVAL_RE = re.compile(r"(\d+(?:\.0)?)(?:-(\d+(?:\.0)?))?")
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _parse_trailing_zero(level: str) -> Tuple[bool, int]:
-        parts = level.split(".")
-        if len(parts) > 2 or (len(parts) == 2 and parts[1] != "0"):
+        match = LevelIterator._LEVEL_RE.fullmatch(level)
+        if match is None:
             raise RuntimeError(f"Invalid: {level}")
-        if len(parts) == 2:
-            return True, int(parts[0])
-        return False, int(parts[0])
+        return match.group(2) is not None, int(match.group(1))
 
     @staticmethod
-    def _parse(level_conf: str) -> List[str]:
+    @functools.lru_cache(maxsize=None)
+    def _parse(level_conf: str) -> Tuple[str, ...]:
         retval = []
         parts = level_conf.split(",")
         for part in parts:
-            interval = part.split("-")
-            if len(interval) == 1:
+            match = LevelIterator._INTERVAL_RE.fullmatch(part)
+            if match is None:
+                raise RuntimeError(f"Invalid range: {part}")
+            zero, start = LevelIterator._parse_trailing_zero(match.group(1))
+            if match.group(2) is None:
                 # No interval
-                zero, start = LevelIterator._parse_trailing_zero(interval[0])
                 end = start
-            elif len(interval) == 2:
-                s_zero, start = LevelIterator._parse_trailing_zero(interval[0])
-                e_zero, end = LevelIterator._parse_trailing_zero(interval[1])
-                zero = s_zero or e_zero
             else:
-                raise RuntimeError(f"Invalid range: {interval}")
+                e_zero, end = LevelIterator._parse_trailing_zero(match.group(2))
+                zero = zero or e_zero
             for i in range(start, end + 1):
                 retval.append(str(i) + (".0" if zero else ""))
 
-        return retval
+        return tuple(retval)
 
     @staticmethod
-    def _resolve(parent: str, level: Tuple[str, ...], offset: int = 0) -> List[str]:
-        retval = []
+    @functools.lru_cache(maxsize=None)
+    def _resolve(parent: str, level: Tuple[str, ...], offset: int = 0) -> Tuple[str, ...]:
+        retval: List[str] = []
         for stage in LevelIterator._parse(level[0]):
             zero, num = LevelIterator._parse_trailing_zero(stage)
             num += offset
@@ -125,7 +178,7 @@ class LevelIterator:
 
             if len(level) > 1:
                 retval.extend(LevelIterator._resolve(parent + str(num) + ".", level[1:]))
-        return retval
+        return tuple(retval)
 
     def __iter__(self) -> Generator[str, None, None]:
         offset = 0
@@ -145,33 +198,74 @@ class LevelIterator:
             offset = last_top
 
 
-def gen_paragraph(word_list: List[str], seed: int, num_words: int) -> str:
-    paragraph = []
-    for i in range(num_words):
-        word_idx = ((seed + i) * 345) % len(word_list)
-        paragraph.append(word_list[word_idx])
-    return " ".join(paragraph).capitalize()
-
-
-def generate_tree(root: Path, num_docs: int, num_req: int) -> None:
+@functools.lru_cache(maxsize=8192)
+def gen_paragraph(seed: int, num_words: int) -> bytes:
+    """Generate a deterministic paragraph, cached since seeds repeat between documents."""
     word_list = get_word_list()
-
-    prev_doc_prefix = ""
-    for d_idx in range(num_docs):
-        doc_prefix = "REQ-" + chr(ord("A") + d_idx)
-        doc_root = root / doc_prefix
-        doc_root.mkdir()
-        (doc_root / ".doorstop.yml").write_text(
-            DOT_DOORSTOP_TEMPLATE.format(
-                prefix=doc_prefix,
-                parent=f"parent: {prev_doc_prefix}" if prev_doc_prefix != "" else "",
-            )
-        )
-        out_image_rel = "images/sample.svg"
-        out_image = doc_root / out_image_rel
-        out_image.parent.mkdir()
-        out_image.write_bytes((REPO_ROOT / "ui/icons/check.svg").read_bytes())
-        for i_idx, level in enumerate(LevelIterator(num_req)):
+    size = len(word_list)
+    # Word i is picked at index (seed + i) * 345, i.e. a range with step 345.
+    words = [word_list[idx % size] for idx in range(seed * 345, (seed + num_words) * 345, 345)]
+    return b" ".join(words).capitalize()
+
+
+OUT_IMAGE_REL = "images/sample.svg"
+
+
+@functools.lru_cache(maxsize=1)
+def _item_cycle() -> List[Dict[str, bytes]]:
+    """Encoded per-item flags and optional markdown blocks, which repeat every 20 items."""
+    md_list = MD_LIST.encode("utf-8")
+    md_table = MD_TABLE.encode("utf-8")
+    md_plantuml = MD_PLANY_UML.encode("utf-8")
+    md_image = MD_IMAGE.format(path=OUT_IMAGE_REL).encode("utf-8")
+    return [
+        {
+            "active": str((i + 3) % 20 > 0).encode("utf-8"),
+            "normative": str(i % 10 > 0).encode("utf-8"),
+            "custom2": str(i % 2 == 0).encode("utf-8"),
+            "text2": md_list if i % 2 == 0 else b"",
+            "text3": md_table if i % 4 == 0 else b"",
+            "text4": md_plantuml if (i + 1) % 10 == 0 else b"",
+            "text5": md_image if (i + 2) % 4 == 0 else b"",
+        }
+        for i in range(20)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _levels(num_req: int) -> Tuple[str, ...]:
+    """Levels of the items in a document, same for all documents."""
+    return tuple(LevelIterator(num_req))
+
+
+def _doc_prefix(d_idx: int) -> str:
+    return "REQ-" + chr(ord("A") + d_idx)
+
+
+def generate_document(root: Path, d_idx: int, num_req: int) -> None:
+    """Generate document number `d_idx` (parent is document `d_idx - 1`) in tree at `root`."""
+    item_cycle = _item_cycle()
+    doc_prefix = _doc_prefix(d_idx)
+    prev_doc_prefix = _doc_prefix(d_idx - 1) if d_idx > 0 else ""
+    doc_root = root / doc_prefix
+    doc_root.mkdir()
+    write_chunks(
+        doc_root / ".doorstop.yml",
+        _render_dot_doorstop(
+            prefix=doc_prefix,
+            parent=f"parent: {prev_doc_prefix}" if prev_doc_prefix != "" else "",
+        ),
+    )
+    out_image = doc_root / OUT_IMAGE_REL
+    out_image.parent.mkdir()
+    shutil.copyfile(REPO_ROOT / "ui/icons/check.svg", out_image)
+    item_prefix = doc_prefix + "-"
+    # Open item files relative to a descriptor of the document directory (where supported) so that
+    # the directory path is not resolved again for every file.
+    dir_prefix = os.path.join(doc_root, "")  # Plain string, no Path join per file.
+    dir_fd = os.open(doc_root, os.O_RDONLY) if os.open in os.supports_dir_fd else None
+    try:
+        for i_idx, level in enumerate(_levels(num_req)):
             item_id = i_idx + 1
 
             links = ""
@@ -181,25 +275,37 @@ def generate_tree(root: Path, num_docs: int, num_req: int) -> None:
                     links += f"- {link_id}:\n"
             seed = d_idx + i_idx
 
-            with open(doc_root / f"{doc_prefix}-{item_id:03}.yml", "w") as fd:
-                fd.write(
-                    ITEM_TEMPLATE.format(
-                        active=((i_idx + 3) % 20 > 0),
-                        header=gen_paragraph(word_list, seed, 2 + (i_idx % 4)),
-                        links="\n" + links if links != "" else "[]",
-                        normative=(i_idx % 10 > 0),
-                        text1="  " + gen_paragraph(word_list, seed + 1, 10 + (i_idx % 10)),
-                        text2=(MD_LIST if i_idx % 2 == 0 else ""),
-                        text3=(MD_TABLE if i_idx % 4 == 0 else ""),
-                        text4=(MD_PLANY_UML if (i_idx + 1) % 10 == 0 else ""),
-                        text5=(MD_IMAGE.format(path=out_image_rel) if (i_idx + 2) % 4 == 0 else ""),
-                        level=level,
-                        custom1=gen_paragraph(word_list, seed + 2, 1 + (i_idx % 10)),
-                        custom2=i_idx % 2 == 0,
-                    )
-                )
-
-        prev_doc_prefix = doc_prefix
+            name = f"{item_prefix}{item_id:03}.yml"
+            write_chunks(
+                name if dir_fd is not None else dir_prefix + name,
+                _render_item(
+                    **item_cycle[i_idx % 20],
+                    header=gen_paragraph(seed, 2 + (i_idx % 4)),
+                    links="\n" + links if links != "" else "[]",
+                    text1=b"  " + gen_paragraph(seed + 1, 10 + (i_idx % 10)),
+                    level=level,
+                    custom1=gen_paragraph(seed + 2, 1 + (i_idx % 10)),
+                ),
+                dir_fd,
+            )
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+
+def generate_tree(root: Path, num_docs: int, num_req: int, processes: int = 1) -> None:
+    """Generate a sample tree at `root`.
+
+    Documents are independent of each other and are generated in `processes` parallel processes if
+    more than one.
+    """
+    jobs = [(root, d_idx, num_req) for d_idx in range(num_docs)]
+    if processes > 1 and num_docs > 1:
+        with multiprocessing.Pool(min(processes, num_docs)) as pool:
+            pool.starmap(generate_document, jobs)
+    else:
+        for job in jobs:
+            generate_document(*job)
 
 
 def main() -> None:
@@ -212,6 +318,13 @@ def main() -> None:
         help="Max number of requirements per document",
     )
     parser.add_argument("-d", "--num-docs", type=int, default=3, help="Number of documents in tree")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of parallel processes",
+    )
     args = parser.parse_args()
 
     project_root = REPO_ROOT / "dist" / "sample-tree"
@@ -219,7 +332,7 @@ def main() -> None:
         shutil.rmtree(project_root)
     project_root.mkdir(parents=True)
 
-    generate_tree(project_root, args.num_docs, args.count)
+    generate_tree(project_root, args.num_docs, args.count, args.jobs)
     print("Tree generated at:", project_root.as_posix())
 
 
@@ -1,38 +1,156 @@
 #!/usr/bin/env python3
 
+import functools
+import io
 import os
+import re
 import subprocess
+import sys
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, List, Optional
 
 UI_FILES_DIR = Path("ui")
 
 
+@functools.lru_cache(maxsize=None)
+def find_qt_tool(name: str) -> Optional[Path]:
+    """Find Qt tool (uic, rcc) shipped with PySide6.
+
+    Calling the tool directly avoids starting a new python interpreter and importing PySide6 for
+    every file, which is what the `pyside6-uic`/`pyside6-rcc` wrappers do.
+    """
+    try:
+        import PySide6
+    except ImportError:
+        return None
+
+    pyside_dir = Path(PySide6.__file__).resolve().parent
+    exe_name = name + (".exe" if sys.platform == "win32" else "")
+    for candidate in [pyside_dir / "Qt" / "libexec" / exe_name, pyside_dir / exe_name]:
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def uic_command(src: Path, dst: Path) -> List[str]:
+    uic = find_qt_tool("uic")
+    if uic is None:
+        return ["pyside6-uic", str(src), "--from-imports", "-o", dst.as_posix()]
+    return [str(uic), "-g", "python", str(src), "--from-imports", "-o", dst.as_posix()]
+
+
+def rcc_command(src: Path, dst: Path) -> List[str]:
+    rcc = find_qt_tool("rcc")
+    if rcc is None:
+        return ["pyside6-rcc", str(src), "-o", dst.as_posix()]
+    return [str(rcc), "-g", "python", str(src), "-o", dst.as_posix()]
+
+
+def bind_translate(source: str) -> str:
+    """Bind `QCoreApplication.translate` to a local in `retranslateUi`, avoiding a global and an
+    attribute lookup for every translated string."""
+
+    def bind(match: "re.Match[str]") -> str:
+        body = match.group(2).replace("QCoreApplication.translate(", "_tr(")
+        return match.group(1) + "        _tr = QCoreApplication.translate\n" + body
+
+    return re.sub(r"(    def retranslateUi\(self, \w+\):\n)(.*?    # retranslateUi\n)", bind, source, flags=re.DOTALL)
+
+
+def drop_connect_slots_by_name(source: str) -> str:
+    """Remove the `connectSlotsByName` call at the end of `setupUi`.
+
+    It walks all children looking for `on_<name>_<signal>` slots. The application connects all
+    signals explicitly (connections defined in the .ui files are generated as explicit `connect`
+    calls) so it never connects anything.
+    """
+    return re.sub(r"\n +QMetaObject\.connectSlotsByName\(\w+\)\n", "\n", source)
+
+
+def use_cached_translate(source: str) -> str:
+    """Translate through `doorstop_edit.utils.translate` which caches the result. Must be applied
+    after `bind_translate`."""
+    if "        _tr = QCoreApplication.translate\n" not in source:
+        return source
+    source = source.replace("        _tr = QCoreApplication.translate\n", "        _tr = translate\n")
+    return source.replace("\nclass Ui_", "\nfrom doorstop_edit.utils.translate import translate\n\nclass Ui_", 1)
+
+
+def drop_unicode_prefix(source: str) -> str:
+    """Remove the redundant `u` prefix uic puts on every string literal.
+
+    Only affects the size of the generated source, the compiled code is the same.
+    """
+    lines = source.splitlines(keepends=True)
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    # Reversed so that removing a prefix does not shift the column of earlier literals on the same line.
+    for row, col in reversed([tok.start for tok in tokens if tok.type == tokenize.STRING and tok.string[0] in "uU"]):
+        line = lines[row - 1]
+        lines[row - 1] = line[:col] + line[col + 1 :]
+    return "".join(lines)
+
+
+def drop_qt_config_comments(source: str) -> str:
+    """Remove the `#if QT_CONFIG(...)`/`#endif // QT_CONFIG(...)` lines that uic copies from its C++
+    output. They are plain comments in python."""
+    return re.sub(r"^#(?:if|endif //) QT_CONFIG\(\w+\)\n", "", source, flags=re.MULTILINE)
+
+
+# Post-processing applied (in order) to python code generated by uic.
+UI_FIXERS: List[Callable[[str], str]] = [
+    bind_translate,
+    use_cached_translate,
+    drop_connect_slots_by_name,
+    drop_unicode_prefix,
+    drop_qt_config_comments,
+]
+
+
+def post_process_ui(py_file: Path) -> None:
+    source = py_file.read_text("utf-8")
+    for fixer in UI_FIXERS:
+        source = fixer(source)
+    py_file.write_text(source, "utf-8")
+
+
+def run_uic(src: Path, dst: Path) -> None:
+    subprocess.check_call(uic_command(src, dst))
+    post_process_ui(dst)
+
+
+def run_rcc(src: Path, dst: Path) -> None:
+    subprocess.check_call(rcc_command(src, dst))
+
+
 def gen_ui_files() -> None:
     if not UI_FILES_DIR.is_dir():
         raise RuntimeError("Please stand in repository root when running this script.")
     print("Generating UI files...")
-    for p in os.listdir(UI_FILES_DIR):
-        path = Path(p)
-        root = Path("doorstop_edit") / "ui_gen"
-        root.mkdir(exist_ok=True)
-        (root / "__init__.py").touch()
-        if path.suffix == ".ui":
-            py_file = (root / ("ui_" + path.stem)).with_suffix(".py")
-            print(f"  {path.name:<20} -> {py_file}")
-            subprocess.check_call(
-                [
-                    "pyside6-uic",
-                    UI_FILES_DIR / path,
-                    "--from-imports",
-                    "-o",
-                    py_file.as_posix(),
-                ]
-            )
-
-        if path.suffix == ".qrc":
-            py_file = (root / (path.stem + "_rc")).with_suffix(".py")
-            print(f"  {path.name:<20} -> {py_file}")
-            subprocess.check_call(["pyside6-rcc", UI_FILES_DIR / path, "-o", py_file.as_posix()])
+    root = Path("doorstop_edit") / "ui_gen"
+    root.mkdir(exist_ok=True)
+    (root / "__init__.py").touch()
+
+    jobs: List[Callable[[], None]] = []
+    with os.scandir(UI_FILES_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".ui") and entry.is_file():
+                py_file = root / ("ui_" + name[: -len(".ui")] + ".py")
+                print(f"  {name:<20} -> {py_file}")
+                jobs.append(functools.partial(run_uic, Path(entry.path), py_file))
+
+            elif name.endswith(".qrc") and entry.is_file():
+                py_file = root / (name[: -len(".qrc")] + "_rc.py")
+                print(f"  {name:<20} -> {py_file}")
+                jobs.append(functools.partial(run_rcc, Path(entry.path), py_file))
+
+    # Files are independent, run the generators concurrently. Threads are enough since the work is
+    # done in subprocesses.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(jobs)))) as executor:
+        for future in [executor.submit(job) for job in jobs]:
+            future.result()
 
 
 if __name__ == "__main__":